@@ -28,6 +28,13 @@ struct Stats {
 
 static Stats g_stats;
 
+// Must match send_stats.py --baud
+static const uint32_t SERIAL_BAUD = 921600;
+// At 921600 baud a ~270-byte line lands in ~3 ms, faster than loop() drains
+// it between redraws/delays. The default 256-byte RX buffer overflows on
+// long hostnames or --batch bursts, so reserve room for several lines.
+static const size_t SERIAL_RX_BUFFER = 2048;
+
 // Serial line buffer
 static String g_lineBuffer;
 
@@ -593,10 +600,12 @@ static void matrixStep() {
 }
 
 void setup() {
-    Serial.begin(115200);
+    Serial.setRxBufferSize(SERIAL_RX_BUFFER);  // must precede begin()
+    Serial.begin(SERIAL_BAUD);
     delay(500);
 
-    M5.begin(true, false, true, false);
+    // SerialEnable=false: M5.begin() would otherwise reopen Serial at 115200
+    M5.begin(true, false, false, false);
     M5.Power.setPowerWLEDSet(false);
 
     M5.Lcd.setRotation(1);  // wide layout for dashboard
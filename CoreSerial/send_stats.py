@@ -7,18 +7,22 @@ Stream cyberdeck-style system stats over serial to an M5Stack Core1.
 
 Protocol (one line per update, newline-terminated):
 
-    time=...;user=...;hostname=...;cpu=12;ram_percent=26;local_ip=...;public_ip=...;cpu_temp_c=57;net_up_mbps=0.12;net_down_mbps=1.34
+    user=...;hostname=...;ram_total_mb=3950;time=01:45:12 PM;time_24=13:45:12;date=2026-02-27;cpu=12;ram_used_mb=1024;ram_percent=26;load_1=0.21;load_5=0.17;load_15=0.11;local_ip=...;public_ip=...;cpu_temp_c=57;net_up_mbps=0.12;net_down_mbps=1.34
 
-The Core1 firmware parses key=value pairs separated by ';' and updates
-its on-screen widgets accordingly.
+The Core1 firmware parses key=value pairs separated by ';' (in any order)
+and updates its on-screen widgets accordingly.
 """
 
 import argparse
-import datetime as _dt
 import getpass
+import http.client
+import os
+import queue
+import re
+import select
 import socket
+import threading
 import time
-import urllib.request
 from typing import Optional, Tuple
 
 import psutil  # type: ignore
@@ -26,46 +30,266 @@ import serial  # type: ignore
 
 
 _prev_net_bytes: Optional[Tuple[int, int]] = None
-_prev_net_time: Optional[float] = None
-
-_last_public_ip: str = ""
-_last_public_ip_ts: float = 0.0
+_prev_net_mono: Optional[float] = None
+
+# The pricier collectors only run every N ticks; in between collect_stats()
+# repeats their last value.
+_tick = 0
+_NET_SAMPLE_EVERY = 2
+_CPU_TEMP_SAMPLE_EVERY = 5
+_last_net_speeds: Tuple[float, float] = (0.0, 0.0)
+_last_cpu_temp_c: float = 0.0
+
+_last_local_ip: bytes = b""
+_last_local_ip_ts: float = 0.0
+_LOCAL_IP_REFRESH_SECONDS = 60.0
+
+# Written by the public-IP thread, read by the send loop
+_last_public_ip: bytes = b""
 _PUBLIC_IP_REFRESH_SECONDS = 300.0
+# After a failed fetch (e.g. network not up yet at boot), retry sooner
+_PUBLIC_IP_RETRY_SECONDS = 15.0
+
+# Output buffers cycle between the send loop and the serial writer thread
+# and are reused rather than reallocated each tick. When all of them are
+# waiting on the device, new updates are dropped instead of stalling.
+_OUT_BUFFERS = 4
+_OUT_BUFFER_SIZE = 512
+_serial_write_error: Optional[BaseException] = None
+
+# Linux pseudo-files read directly instead of going through psutil. Each fd
+# is opened on first use and kept; -1 means the file isn't available.
+_THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"  # millidegrees C
+_thermal_fd: Optional[int] = None
+_MEMINFO_PATH = "/proc/meminfo"
+_meminfo_fd: Optional[int] = None
+_MEMINFO_RE = re.compile(rb"MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)", re.S)
+_PROC_STAT_PATH = "/proc/stat"
+_proc_stat_fd: Optional[int] = None
+_prev_cpu_ticks: Optional[Tuple[int, int]] = None
+
+# Per-tick part of an update line; sent after the static prefix built by
+# _build_static_prefix(). See the protocol in the module docstring.
+# The three time fields come from a single strftime() call.
+_TIME_FMT = (
+    "time=%I:%M:%S %p;"  # 12-hour for main dashboard
+    "time_24=%H:%M:%S;"  # 24-hour for time-only view
+    "date=%Y-%m-%d;"
+)
+# Formatted as bytes so numbers go straight to the wire format without a
+# separate str.encode() pass. The leading %b is the _TIME_FMT stamp.
+_LINE_FMT = (
+    b"%b"
+    b"cpu=%d;ram_used_mb=%d;ram_percent=%d;"
+    b"load_1=%.2f;load_5=%.2f;load_15=%.2f;"
+    b"local_ip=%b;public_ip=%b;cpu_temp_c=%d;"
+    b"net_up_mbps=%.2f;net_down_mbps=%.2f\n"
+)
+
+
+def _write_all(fd: int, view: memoryview) -> None:
+    """os.write() all of view, waiting out EAGAIN on pyserial's non-blocking fd."""
+    while view:
+        try:
+            view = view[os.write(fd, view):]
+        except BlockingIOError:
+            select.select([], [fd], [])
+
+
+def _serial_writer(
+    ser: "serial.Serial",
+    outbox: "queue.Queue[Tuple[bytearray, int]]",
+    spare: "queue.Queue[bytearray]",
+) -> None:
+    """Write queued (buffer, length) pairs to the serial port; runs on a daemon thread.
+
+    A write that blocks on a full USB buffer only holds up this thread, so
+    the send loop keeps its cadence. Errors are saved for the send loop to
+    raise.
+    """
+    global _serial_write_error
+
+    # Write straight to the POSIX fd to skip pyserial's per-call overhead;
+    # Windows ports have no fd and go through ser.write().
+    fd: Optional[int] = getattr(ser, "fd", None)
+    try:
+        while True:
+            buf, length = outbox.get()
+            if fd is None:
+                ser.write(memoryview(buf)[:length])
+            else:
+                _write_all(fd, memoryview(buf)[:length])
+            spare.put(buf)
+    except (serial.SerialException, OSError) as exc:
+        _serial_write_error = exc
+
+
+def _get_local_ip() -> bytes:
+    """Best-effort local IP discovery that prefers real interfaces over loopback.
 
+    The address rarely changes, so the lookup is cached and only redone every
+    _LOCAL_IP_REFRESH_SECONDS.
+    """
+    global _last_local_ip, _last_local_ip_ts
+
+    now_mono = time.monotonic()
+    if _last_local_ip and (now_mono - _last_local_ip_ts) < _LOCAL_IP_REFRESH_SECONDS:
+        return _last_local_ip
 
-def _get_local_ip() -> str:
-    """Best-effort local IP discovery that prefers real interfaces over loopback."""
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         # We never actually send packets; this just forces a route lookup
         s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
+        ip = s.getsockname()[0].encode("ascii")
         s.close()
-        return ip
     except OSError:
-        return "0.0.0.0"
+        # Not cached, so the next tick retries (e.g. once DHCP completes)
+        return b"0.0.0.0"
+
+    _last_local_ip = ip
+    _last_local_ip_ts = now_mono
+    return ip
+
+
+def _fetch_public_ip(conn: http.client.HTTPSConnection) -> bytes:
+    """Ask ipify for our public IP over an existing (kept-alive) connection."""
+    conn.request("GET", "/")
+    resp = conn.getresponse()
+    body = resp.read()
+    if resp.status != 200:
+        raise http.client.HTTPException(f"HTTP {resp.status}")
+    return body.strip()
+
+
+def _public_ip_worker() -> None:
+    """Refresh the cached public IP forever; runs on a daemon thread.
+
+    Keeping this off the send loop means a slow or dead network never
+    stalls the serial stream. The connection is reused between refreshes
+    to avoid a fresh TLS handshake each time.
+    """
+    global _last_public_ip
+
+    conn = http.client.HTTPSConnection("api.ipify.org", timeout=2.0)
+    while True:
+        # Two attempts: the server may have dropped the idle keep-alive
+        # connection since the last refresh.
+        delay = _PUBLIC_IP_REFRESH_SECONDS
+        for _ in range(2):
+            try:
+                _last_public_ip = _fetch_public_ip(conn)
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+        else:
+            if not _last_public_ip:
+                _last_public_ip = b"n/a"
+            delay = _PUBLIC_IP_RETRY_SECONDS
+        time.sleep(delay)
+
+
+def _open_pseudo_file(path: str) -> int:
+    """Open a /proc or /sys file for repeated reads, or return -1."""
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return -1
 
 
-def _maybe_refresh_public_ip(now_epoch: float) -> str:
-    """Fetch public IP occasionally, cache between calls."""
-    global _last_public_ip, _last_public_ip_ts
+def _read_sysfs_cpu_temp_c() -> Optional[float]:
+    """Read the CPU temperature straight from sysfs, or None if unavailable."""
+    global _thermal_fd
 
-    if _last_public_ip and (now_epoch - _last_public_ip_ts) < _PUBLIC_IP_REFRESH_SECONDS:
-        return _last_public_ip
+    if _thermal_fd is None:
+        _thermal_fd = _open_pseudo_file(_THERMAL_ZONE_PATH)
+    if _thermal_fd < 0:
+        return None
 
     try:
-        with urllib.request.urlopen("https://api.ipify.org", timeout=2.0) as resp:
-            _last_public_ip = resp.read().decode("utf-8", errors="ignore").strip()
-            _last_public_ip_ts = now_epoch
-    except Exception:
-        if not _last_public_ip:
-            _last_public_ip = "n/a"
+        return int(os.pread(_thermal_fd, 16, 0)) / 1000.0
+    except (OSError, ValueError):
+        return None
+
 
-    return _last_public_ip
+def _read_proc_meminfo_kb() -> Optional[Tuple[int, int]]:
+    """Return (MemTotal, MemAvailable) in KiB from /proc/meminfo, or None."""
+    global _meminfo_fd
+
+    if _meminfo_fd is None:
+        _meminfo_fd = _open_pseudo_file(_MEMINFO_PATH)
+    if _meminfo_fd < 0:
+        return None
+
+    try:
+        m = _MEMINFO_RE.search(os.pread(_meminfo_fd, 4096, 0))
+    except OSError:
+        return None
+    if m is None:
+        return None
+    return int(m.group(1)), int(m.group(2))
+
+
+def _get_ram_usage() -> Tuple[int, float]:
+    """Return (used_mb, percent) of RAM, counting reclaimable cache as free."""
+    meminfo = _read_proc_meminfo_kb()
+    if meminfo is not None:
+        total_kb, avail_kb = meminfo
+        used_kb = total_kb - avail_kb
+        return used_kb // 1024, (used_kb * 100.0 / total_kb) if total_kb else 0.0
+
+    vm = psutil.virtual_memory()
+    return vm.used // (1024 * 1024), vm.percent
+
+
+def _read_proc_stat_cpu_ticks() -> Optional[Tuple[int, int]]:
+    """Return (busy, total) jiffies from the aggregate line of /proc/stat, or None."""
+    global _proc_stat_fd
+
+    if _proc_stat_fd is None:
+        _proc_stat_fd = _open_pseudo_file(_PROC_STAT_PATH)
+    if _proc_stat_fd < 0:
+        return None
+
+    try:
+        # "cpu  user nice system idle iowait irq softirq steal guest guest_nice"
+        fields = os.pread(_proc_stat_fd, 256, 0).split(b"\n", 1)[0].split()
+        if fields[0] != b"cpu":
+            return None
+        ticks = [int(f) for f in fields[1:9]]  # guest time is already in user
+    except (OSError, ValueError, IndexError):
+        return None
+
+    total = sum(ticks)
+    idle = ticks[3] + ticks[4]
+    return total - idle, total
+
+
+def _get_cpu_percent() -> float:
+    """Return system-wide CPU usage since the last call (0.0 on the first)."""
+    global _prev_cpu_ticks
+
+    ticks = _read_proc_stat_cpu_ticks()
+    if ticks is None:
+        return psutil.cpu_percent(interval=None)
+
+    prev = _prev_cpu_ticks
+    _prev_cpu_ticks = ticks
+    if prev is None:
+        return 0.0
+
+    total_delta = ticks[1] - prev[1]
+    if total_delta <= 0:
+        return 0.0
+    return max(0.0, (ticks[0] - prev[0]) * 100.0 / total_delta)
 
 
 def _get_cpu_temp_c() -> float:
     """Return CPU temperature in Celsius if available, else 0.0."""
+    # A single small read; much cheaper than psutil enumerating every sensor
+    temp_c = _read_sysfs_cpu_temp_c()
+    if temp_c is not None:
+        return temp_c
+
     if not hasattr(psutil, "sensors_temperatures"):
         return 0.0
     try:
@@ -88,21 +312,23 @@ def _get_cpu_temp_c() -> float:
     return 0.0
 
 
-def _get_net_speeds_mbps(now_epoch: float) -> Tuple[float, float]:
+def _get_net_speeds_mbps() -> Tuple[float, float]:
     """Return (up_mbps, down_mbps) based on deltas from last call."""
-    global _prev_net_bytes, _prev_net_time
+    global _prev_net_bytes, _prev_net_mono
 
     try:
         counters = psutil.net_io_counters()
     except Exception:
         return 0.0, 0.0
 
-    if _prev_net_bytes is None or _prev_net_time is None:
+    # Monotonic so wall-clock steps (NTP, manual changes) can't skew the rate
+    now_mono = time.monotonic()
+    if _prev_net_bytes is None or _prev_net_mono is None:
         _prev_net_bytes = (counters.bytes_sent, counters.bytes_recv)
-        _prev_net_time = now_epoch
+        _prev_net_mono = now_mono
         return 0.0, 0.0
 
-    dt = now_epoch - _prev_net_time
+    dt = now_mono - _prev_net_mono
     if dt <= 0:
         return 0.0, 0.0
 
@@ -110,28 +336,33 @@ def _get_net_speeds_mbps(now_epoch: float) -> Tuple[float, float]:
     recv_delta = counters.bytes_recv - _prev_net_bytes[1]
 
     _prev_net_bytes = (counters.bytes_sent, counters.bytes_recv)
-    _prev_net_time = now_epoch
+    _prev_net_mono = now_mono
 
     up_mbps = max(0.0, (sent_delta * 8.0) / dt / 1_000_000.0)
     down_mbps = max(0.0, (recv_delta * 8.0) / dt / 1_000_000.0)
     return up_mbps, down_mbps
 
 
-def collect_stats() -> str:
-    """Collect a single snapshot of system stats and return encoded line."""
+def _build_static_prefix(user: str, hostname: str) -> str:
+    """Return the fields that never change while the sender runs.
+
+    The caller encodes this once and puts it in front of every line from
+    collect_stats().
+    """
+    ram_total_mb = psutil.virtual_memory().total // (1024 * 1024)
+    return f"user={user};hostname={hostname};ram_total_mb={ram_total_mb};"
+
+
+def collect_stats() -> bytes:
+    """Collect the changing system stats as a newline-terminated, encoded line."""
+    global _tick, _last_net_speeds, _last_cpu_temp_c
+
     now_epoch = time.time()
-    now_dt = _dt.datetime.fromtimestamp(now_epoch)
-    date_str = now_dt.strftime("%Y-%m-%d")
-    time_str = now_dt.strftime("%I:%M:%S %p")  # 12-hour for main dashboard
-    time24_str = now_dt.strftime("%H:%M:%S")   # 24-hour for time-only view
-    user = getpass.getuser()
-    hostname = socket.gethostname()
-    cpu_pct = psutil.cpu_percent(interval=None)
+    now_tm = time.localtime(now_epoch)
+    stamp = time.strftime(_TIME_FMT, now_tm).encode("utf-8", errors="ignore")
+    cpu_pct = _get_cpu_percent()
 
-    vm = psutil.virtual_memory()
-    ram_used_mb = vm.used // (1024 * 1024)
-    ram_total_mb = vm.total // (1024 * 1024)
-    ram_percent = vm.percent
+    ram_used_mb, ram_percent = _get_ram_usage()
 
     load1, load5, load15 = (0.0, 0.0, 0.0)
     if hasattr(psutil, "getloadavg"):
@@ -141,31 +372,30 @@ def collect_stats() -> str:
             pass
 
     local_ip = _get_local_ip()
-    public_ip = _maybe_refresh_public_ip(now_epoch)
-    cpu_temp_c = _get_cpu_temp_c()
-    up_mbps, down_mbps = _get_net_speeds_mbps(now_epoch)
+    public_ip = _last_public_ip or b"n/a"
+    if _tick % _CPU_TEMP_SAMPLE_EVERY == 0:
+        _last_cpu_temp_c = _get_cpu_temp_c()
+    if _tick % _NET_SAMPLE_EVERY == 0:
+        _last_net_speeds = _get_net_speeds_mbps()
+    _tick += 1
+    cpu_temp_c = _last_cpu_temp_c
+    up_mbps, down_mbps = _last_net_speeds
 
     # Send temp and usages as integers (no decimals) for display as "57C, 15%"
-    parts = [
-        f"time={time_str}",
-        f"time_24={time24_str}",
-        f"date={date_str}",
-        f"user={user}",
-        f"hostname={hostname}",
-        f"cpu={int(round(cpu_pct))}",
-        f"ram_used_mb={ram_used_mb}",
-        f"ram_total_mb={ram_total_mb}",
-        f"ram_percent={int(round(ram_percent))}",
-        f"load_1={load1:.2f}",
-        f"load_5={load5:.2f}",
-        f"load_15={load15:.2f}",
-        f"local_ip={local_ip}",
-        f"public_ip={public_ip}",
-        f"cpu_temp_c={int(round(cpu_temp_c))}",
-        f"net_up_mbps={up_mbps:.2f}",
-        f"net_down_mbps={down_mbps:.2f}",
-    ]
-    return ";".join(parts)
+    return _LINE_FMT % (
+        stamp,
+        round(cpu_pct),
+        ram_used_mb,
+        round(ram_percent),
+        load1,
+        load5,
+        load15,
+        local_ip,
+        public_ip,
+        round(cpu_temp_c),
+        up_mbps,
+        down_mbps,
+    )
 
 
 def main() -> None:
@@ -182,8 +412,8 @@ def main() -> None:
         "--baud",
         "-b",
         type=int,
-        default=115200,
-        help="Baud rate (default: 115200)",
+        default=921600,
+        help="Baud rate; must match the firmware (default: 921600)",
     )
     parser.add_argument(
         "--interval",
@@ -192,23 +422,104 @@ def main() -> None:
         default=1.0,
         help="Update interval in seconds (default: 1.0)",
     )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Number of updates to buffer per serial write (default: 1)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Print every line queued for (or dropped before) the Core1",
+    )
 
     args = parser.parse_args()
+    if args.batch < 1:
+        parser.error("--batch must be at least 1")
 
     print(f"[CoreSerial] Opening serial port {args.port} @ {args.baud} baud...")
     ser = serial.Serial(args.port, args.baud, timeout=1)
+    # Have the USB-serial driver push bytes out immediately instead of
+    # holding them for its latency timer. Linux only, and not every driver
+    # supports it.
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError):
+        pass
+
+    user = getpass.getuser()
+    hostname = socket.gethostname()
+    prefix = _build_static_prefix(user, hostname)
+    prefix_bytes = prefix.encode("utf-8", errors="ignore")
+    threading.Thread(target=_public_ip_worker, name="public-ip", daemon=True).start()
 
     # Give the Core1 a moment after opening the port (in case it auto-resets)
     time.sleep(2.0)
 
+    # No flush() after write(): pyserial already hands the bytes to the OS
+    # driver, and waiting for the drain only adds latency to each tick.
+    outbox: "queue.Queue[Tuple[bytearray, int]]" = queue.Queue()
+    spare: "queue.Queue[bytearray]" = queue.Queue()
+    for _ in range(_OUT_BUFFERS):
+        spare.put(bytearray(_OUT_BUFFER_SIZE))
+    threading.Thread(
+        target=_serial_writer,
+        args=(ser, outbox, spare),
+        name="serial-writer",
+        daemon=True,
+    ).start()
+
+    buf: Optional[bytearray] = None
+    length = 0
+    pending = 0
+    # Hoist attribute lookups out of the loop; locals are cheaper to load
+    interval = args.interval
+    batch = args.batch
+    verbose = args.verbose
+    monotonic = time.monotonic
+    sleep = time.sleep
+    get_spare = spare.get_nowait
+    put_out = outbox.put
+
+    # Sleep until an absolute deadline so the time spent collecting and
+    # sending doesn't add to the period and drift the cadence.
+    next_tick = monotonic()
     try:
         while True:
+            if _serial_write_error is not None:
+                raise _serial_write_error
             line = collect_stats()
-            encoded = (line + "\n").encode("utf-8", errors="ignore")
-            ser.write(encoded)
-            ser.flush()
-            print(f"[CoreSerial] Sent: {line}")
-            time.sleep(args.interval)
+            if buf is None:
+                try:
+                    buf = get_spare()
+                except queue.Empty:
+                    # Device isn't keeping up; skip rather than block
+                    if verbose:
+                        print("[CoreSerial] Dropped update: serial writer is behind")
+            if buf is not None:
+                # Slice assignment overwrites in place and only grows the
+                # buffer if a batch ever outgrows it.
+                for chunk in (prefix_bytes, line):
+                    buf[length:length + len(chunk)] = chunk
+                    length += len(chunk)
+                pending += 1
+                if verbose:
+                    print(f"[CoreSerial] Queued: {prefix}{line.decode('utf-8')}", end="")
+                if pending >= batch:
+                    put_out((buf, length))
+                    buf = None
+                    length = 0
+                    pending = 0
+            next_tick += interval
+            sleep_for = next_tick - monotonic()
+            if sleep_for > 0:
+                sleep(sleep_for)
+            elif sleep_for < -interval:
+                # Fell more than a tick behind (e.g. suspend); resync rather
+                # than bursting out the missed updates.
+                next_tick = monotonic()
     except KeyboardInterrupt:
         print("\n[CoreSerial] Stopping sender...")
     finally: